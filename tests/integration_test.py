@@ -5,29 +5,59 @@ Pulse Server Monitoring - Integration Test Suite
 This test suite validates the API endpoints and web app functionality.
 Run with: python3 tests/integration_test.py
 
-Requirements: pip install requests
+Requirements: pip install requests (orjson is used for JSON when installed)
 """
 
 import argparse
 import json
+import re
+import socket
 import sys
+import threading
 import time
-from dataclasses import dataclass
-from typing import Optional
-import urllib.request
-import urllib.error
-
-# ANSI color codes
-GREEN = '\033[92m'
-RED = '\033[91m'
-YELLOW = '\033[93m'
-BLUE = '\033[94m'
-RESET = '\033[0m'
-BOLD = '\033[1m'
-
-
-@dataclass
-class TestResult:
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import NamedTuple, Optional
+from urllib.parse import urlsplit
+
+import requests
+import urllib3.util.connection
+from requests.adapters import HTTPAdapter
+
+# orjson is optional; the stdlib codec also accepts bytes. Decode failures from
+# either (bad JSON or bad UTF-8) are ValueErrors
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    json_loads = json.loads
+
+# ANSI color codes (left empty when output is not a terminal, e.g. redirected to a file)
+_COLOR = sys.stdout.isatty()
+GREEN = '\033[92m' if _COLOR else ''
+RED = '\033[91m' if _COLOR else ''
+YELLOW = '\033[93m' if _COLOR else ''
+BLUE = '\033[94m' if _COLOR else ''
+RESET = '\033[0m' if _COLOR else ''
+BOLD = '\033[1m' if _COLOR else ''
+
+# Pre-formatted output fragments
+PASS_LABEL = f"{GREEN}PASS{RESET}"
+FAIL_LABEL = f"{RED}FAIL{RESET}"
+SEP = "-" * 40
+DIV_RULE = "=" * 60
+BOLD_DIV = f"{BOLD}{DIV_RULE}{RESET}"
+
+# Upper bound on requests in flight; the session pool holds the same number of connections
+MAX_WORKERS = 16
+
+# HTML checks only sniff the start of a response body for a document marker
+SNIFF_BYTES = 512
+HTML_MARKER = re.compile(rb'<!doctype html|<html', re.IGNORECASE)
+
+
+class TestResult(NamedTuple):
     name: str
     passed: bool
     message: str
@@ -37,79 +67,257 @@ class TestResult:
 class PulseTestSuite:
     """Integration test suite for Pulse Server Monitoring"""
     
+    # Request bodies that never change, encoded once
+    _ADMIN_LOGIN_BODY = json_dumps({'username': 'admin', 'password': 'admin123'})
+    _INVALID_LOGIN_BODY = json_dumps({'username': 'invalid', 'password': 'wrongpassword'})
+    _EMPTY_BODY = b'{}'
+    
+    # Shared by every unauthenticated request without extra headers; never mutated
+    _BASE_HEADERS = {'Content-Type': 'application/json'}
+    
+    # Endpoints that must reject requests without a bearer token
+    _PROTECTED_ENDPOINTS = [
+        ('GET', '/api/v1/auth/me'),
+        ('GET', '/api/v1/servers'),
+        ('GET', '/api/v1/alerts/rules'),
+        ('GET', '/api/v1/settings/notifications'),
+    ]
+    
     def __init__(self, api_url: str, web_url: Optional[str] = None):
         self.api_url = api_url.rstrip('/')
         self.web_url = web_url.rstrip('/') if web_url else None
-        self.results: list[TestResult] = []
-        self.access_token: Optional[str] = None
+        self._sections = self.API_TESTS + (self.WEB_TESTS if self.web_url else [])
+        # One slot per test, filled by index so concurrent workers never share a write
+        self.results: list[Optional[TestResult]] = [None] * sum(
+            len(chain) for _, _, chains in self._sections for chain in chains)
+        self._access_token: Optional[str] = None
         self.refresh_token: Optional[str] = None
+        
+        # Server shared by the read-only sub-resource tests (metrics, containers)
+        self._fixture_server_id: Optional[str] = None
+        self._setup_error: Optional[str] = None
+        
+        # Ids of resources created by one test and consumed by the next in its chain
+        self._test_server_id: Optional[str] = None
+        self._test_alert_rule_id: Optional[str] = None
+        self._test_notification_channel_id: Optional[str] = None
+        
+        # Tests run on worker threads; auth-toggling tests override the token
+        # per thread so they don't race each other
+        self._local = threading.local()
+        
+        # One keep-alive pool for every request so tests don't each pay a fresh TCP/TLS handshake
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_WORKERS)
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        
+        # (host, port) -> IP addresses resolved once per suite. New pooled connections
+        # dial these directly instead of repeating getaddrinfo; Host headers and TLS
+        # still use the original hostname. urllib3's factory is swapped only until close().
+        self._resolved_hosts: dict[tuple[str, int], list[str]] = {}
+        self._resolve_host(self.api_url)
+        if self.web_url:
+            self._resolve_host(self.web_url)
+        self._urllib3_create_connection = urllib3.util.connection.create_connection
+        urllib3.util.connection.create_connection = self._create_connection
+    
+    @property
+    def access_token(self) -> Optional[str]:
+        """Bearer token for the calling thread, falling back to the shared login token"""
+        return getattr(self._local, 'access_token', self._access_token)
+    
+    @access_token.setter
+    def access_token(self, value: Optional[str]):
+        self._access_token = value
+    
+    @contextmanager
+    def _no_auth(self, token: Optional[str] = None):
+        """Send requests on the calling thread without the shared token (or with `token` instead)"""
+        self._local.access_token = token
+        try:
+            yield
+        finally:
+            del self._local.access_token
+    
+    def close(self):
+        """Release pooled connections and restore urllib3's connection factory"""
+        self._session.close()
+        if urllib3.util.connection.create_connection == self._create_connection:
+            urllib3.util.connection.create_connection = self._urllib3_create_connection
+    
+    def __enter__(self) -> 'PulseTestSuite':
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def _resolve_host(self, url: str) -> None:
+        """Resolve the host of `url` once and cache its addresses for new connections"""
+        parts = urlsplit(url)
+        if not parts.hostname:
+            return
+        port = parts.port or (443 if parts.scheme == 'https' else 80)
+        try:
+            infos = socket.getaddrinfo(parts.hostname, port, type=socket.SOCK_STREAM)
+        except socket.gaierror:
+            # Leave it to the first request to report the resolution failure
+            return
+        self._resolved_hosts[(parts.hostname, port)] = list(dict.fromkeys(info[4][0] for info in infos))
+    
+    def _create_connection(self, address, *args, **kwargs):
+        """urllib3 connection factory that prefers the pre-resolved addresses"""
+        ips = self._resolved_hosts.get(address)
+        if not ips:
+            return self._urllib3_create_connection(address, *args, **kwargs)
+        
+        err = None
+        for ip in ips:
+            try:
+                return self._urllib3_create_connection((ip, address[1]), *args, **kwargs)
+            except OSError as e:
+                err = e
+        raise err
     
     def _request(self, method: str, path: str, data: Optional[dict] = None,
-                 headers: Optional[dict] = None, expected_status: int = 200) -> tuple[int, dict]:
-        """Make an HTTP request and return status code and response data"""
+                 headers: Optional[dict] = None, expected_status: int = 200,
+                 raw_body: Optional[bytes] = None, parse_body: bool = True) -> tuple[int, dict]:
+        """Make an HTTP request and return status code and response data.
+        
+        raw_body is sent as-is in place of data for pre-encoded JSON payloads.
+        With parse_body=False the response is not JSON-decoded and {} is returned
+        for callers that only check the status.
+        """
         url = f"{self.api_url}{path}"
-        req_headers = {'Content-Type': 'application/json'}
-        if headers:
-            req_headers.update(headers)
-        if self.access_token:
-            req_headers['Authorization'] = f'Bearer {self.access_token}'
+        token = self.access_token
+        if headers or token:
+            req_headers = {**self._BASE_HEADERS, **(headers or {})}
+            if token:
+                req_headers['Authorization'] = f'Bearer {token}'
+        else:
+            req_headers = self._BASE_HEADERS
         
-        body = json.dumps(data).encode() if data else None
-        req = urllib.request.Request(url, data=body, headers=req_headers, method=method)
+        if raw_body is not None:
+            body = raw_body
+        else:
+            body = json_dumps(data) if data else None
         
         try:
-            with urllib.request.urlopen(req, timeout=10) as response:
-                status = response.status
-                try:
-                    resp_data = json.loads(response.read().decode())
-                except json.JSONDecodeError:
-                    resp_data = {}
-        except urllib.error.HTTPError as e:
-            status = e.code
-            try:
-                resp_data = json.loads(e.read().decode())
-            except json.JSONDecodeError:
-                resp_data = {'error': str(e)}
-        except urllib.error.URLError as e:
+            response = self._session.request(method, url, data=body, headers=req_headers, timeout=10)
+        except requests.RequestException as e:
             return -1, {'error': str(e)}
         
+        status = response.status_code
+        if not parse_body:
+            return status, {}
+        try:
+            resp_data = json_loads(response.content)
+        except ValueError:
+            resp_data = {'error': f"HTTP Error {status}: {response.reason}"} if status >= 400 else {}
+        
         return status, resp_data
     
-    def _web_request(self, path: str = '/') -> tuple[int, str]:
-        """Make an HTTP request to the web app"""
+    def _web_request(self, path: str = '/', method: str = 'GET',
+                     max_bytes: Optional[int] = None) -> tuple[int, bytes]:
+        """Make an HTTP request to the web app and return the body (at most max_bytes of it)"""
         if not self.web_url:
-            return -1, "Web URL not configured"
+            return -1, b"Web URL not configured"
         
         url = f"{self.web_url}{path}"
-        req = urllib.request.Request(url)
         
         try:
-            with urllib.request.urlopen(req, timeout=10) as response:
-                return response.status, response.read().decode()
-        except urllib.error.HTTPError as e:
-            return e.code, str(e)
-        except urllib.error.URLError as e:
-            return -1, str(e)
-    
-    def run_test(self, name: str, test_func) -> bool:
-        """Run a single test and record the result"""
-        start_time = time.time()
+            response = self._session.request(method, url, timeout=10, stream=True)
+        except requests.RequestException as e:
+            return -1, str(e).encode()
+        
+        # Closing the streamed response skips downloading the rest of the body
+        with response:
+            if response.status_code >= 400:
+                return response.status_code, f"HTTP Error {response.status_code}: {response.reason}".encode()
+            return response.status_code, response.raw.read(max_bytes, decode_content=True)
+    
+    @staticmethod
+    def _looks_like_html(content: bytes) -> bool:
+        """Check a (sniffed) response body for an HTML document marker"""
+        return HTML_MARKER.search(content) is not None
+    
+    def _ensure_auth(self) -> bool:
+        """Log in as the default admin unless a token is already held"""
+        if self.access_token:
+            return True
+        
+        status, data = self._request('POST', '/api/v1/auth/login', raw_body=self._ADMIN_LOGIN_BODY)
+        if status != 200 or not isinstance(data, dict):
+            return False
+        self.access_token = data.get('access_token')
+        return bool(self.access_token)
+    
+    def _setup_session(self) -> bool:
+        """Log in and create fixtures for the authenticated sections.
+        
+        Every authenticated chain waits on this, so it reports failure by returning
+        False (with the reason in _setup_error if it raised) instead of raising.
+        """
         try:
-            passed, message = test_func()
-            duration_ms = (time.time() - start_time) * 1000
-            self.results.append(TestResult(name, passed, message, duration_ms))
-            
-            status = f"{GREEN}PASS{RESET}" if passed else f"{RED}FAIL{RESET}"
-            print(f"  {status} {name} ({duration_ms:.1f}ms)")
-            if not passed:
-                print(f"       {YELLOW}{message}{RESET}")
-            return passed
+            if not self._ensure_auth():
+                return False
+            self._setup_fixtures()
         except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            self.results.append(TestResult(name, False, str(e), duration_ms))
-            print(f"  {RED}FAIL{RESET} {name} ({duration_ms:.1f}ms)")
-            print(f"       {YELLOW}{e}{RESET}")
+            self._setup_error = str(e)
             return False
+        return True
+    
+    def _setup_fixtures(self) -> None:
+        """Create the shared fixture server used by the read-only server tests"""
+        status, data = self._request('POST', '/api/v1/servers', {
+            'name': 'Fixture Test Server',
+            'hostname': 'fixture.example.com',
+            'port': 22
+        })
+        if status in [200, 201] and isinstance(data, dict):
+            server = data.get('server')
+            if isinstance(server, dict) and server.get('id'):
+                self._fixture_server_id = server['id']
+            else:
+                self._fixture_server_id = data.get('id')
+    
+    def _teardown_fixtures(self) -> None:
+        """Delete the shared fixture server"""
+        if self._fixture_server_id:
+            self._request('DELETE', f'/api/v1/servers/{self._fixture_server_id}', parse_body=False)
+            self._fixture_server_id = None
+    
+    def run_test(self, idx: int, name: str, test_func) -> TestResult:
+        """Run a single test method and record the result in slot `idx`"""
+        start_ns = time.perf_counter_ns()
+        try:
+            passed, message = test_func(self)
+        except Exception as e:
+            passed, message = False, str(e)
+        duration_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        
+        result = TestResult(name, passed, message, duration_ms)
+        self.results[idx] = result
+        return result
+    
+    def _run_chain(self, start: int, chain: list, after=None) -> None:
+        """Run tests that share state (e.g. create -> update -> delete) in order.
+        
+        If `after` is given, the chain waits for that future (the shared setup) first.
+        """
+        if after is not None:
+            after.result()
+        for offset, (name, test_func) in enumerate(chain):
+            self.run_test(start + offset, name, test_func)
+    
+    @staticmethod
+    def _print_result(result: TestResult) -> None:
+        """Print a test result (and failure detail) with a single write"""
+        status = PASS_LABEL if result.passed else FAIL_LABEL
+        line = f"  {status} {result.name} ({result.duration_ms:.1f}ms)\n"
+        if not result.passed:
+            line += f"       {YELLOW}{result.message}{RESET}\n"
+        sys.stdout.write(line)
 
     # ==================== API Tests ====================
     
@@ -137,27 +345,25 @@ class PulseTestSuite:
     
     def test_login_invalid_credentials(self) -> tuple[bool, str]:
         """Test login with invalid credentials"""
-        status, data = self._request('POST', '/api/v1/auth/login', {
-            'username': 'invalid',
-            'password': 'wrongpassword'
-        })
+        with self._no_auth():
+            status, data = self._request('POST', '/api/v1/auth/login',
+                                         raw_body=self._INVALID_LOGIN_BODY, parse_body=False)
         if status != 401:
             return False, f"Expected 401, got {status}"
         return True, "Invalid credentials rejected"
     
     def test_login_missing_fields(self) -> tuple[bool, str]:
         """Test login with missing fields"""
-        status, data = self._request('POST', '/api/v1/auth/login', {})
+        with self._no_auth():
+            status, data = self._request('POST', '/api/v1/auth/login', raw_body=self._EMPTY_BODY,
+                                         parse_body=False)
         if status not in [400, 401]:
             return False, f"Expected 400 or 401, got {status}"
         return True, "Missing fields rejected"
     
     def test_login_valid_credentials(self) -> tuple[bool, str]:
         """Test login with valid credentials and validate response format"""
-        status, data = self._request('POST', '/api/v1/auth/login', {
-            'username': 'admin',
-            'password': 'admin123'
-        })
+        status, data = self._request('POST', '/api/v1/auth/login', raw_body=self._ADMIN_LOGIN_BODY)
         if status != 200:
             return False, f"Expected 200, got {status}"
         
@@ -206,33 +412,31 @@ class PulseTestSuite:
         
         return True, f"Login successful for user '{user['username']}'"
     
-    def test_protected_endpoint_without_auth(self) -> tuple[bool, str]:
-        """Test accessing protected endpoint without authentication"""
-        old_token = self.access_token
-        self.access_token = None
-        try:
-            status, data = self._request('GET', '/api/v1/auth/me')
-            if status != 401:
-                return False, f"Expected 401, got {status}"
-            return True, "Protected endpoint requires auth"
-        finally:
-            self.access_token = old_token
+    def test_protected_endpoints_require_auth(self) -> tuple[bool, str]:
+        """Test that every protected endpoint rejects unauthenticated requests"""
+        failures = []
+        with self._no_auth():
+            for method, path in self._PROTECTED_ENDPOINTS:
+                status, data = self._request(method, path, parse_body=False)
+                if status != 401:
+                    failures.append(f"{method} {path} -> {status}")
+        if failures:
+            return False, f"Expected 401 from: {', '.join(failures)}"
+        return True, f"{len(self._PROTECTED_ENDPOINTS)} protected endpoints require auth"
     
     def test_protected_endpoint_invalid_token(self) -> tuple[bool, str]:
         """Test accessing protected endpoint with invalid token"""
-        old_token = self.access_token
-        self.access_token = 'invalid.token.here'
-        try:
-            status, data = self._request('GET', '/api/v1/auth/me')
+        with self._no_auth('invalid.token.here'):
+            status, data = self._request('GET', '/api/v1/auth/me', parse_body=False)
             if status != 401:
                 return False, f"Expected 401, got {status}"
             return True, "Invalid token rejected"
-        finally:
-            self.access_token = old_token
     
     def test_logout_without_token(self) -> tuple[bool, str]:
         """Test logout without refresh token"""
-        status, data = self._request('POST', '/api/v1/auth/logout', {})
+        with self._no_auth():
+            status, data = self._request('POST', '/api/v1/auth/logout', raw_body=self._EMPTY_BODY,
+                                         parse_body=False)
         # Should fail without proper token
         if status in [400, 401]:
             return True, "Logout without token rejected"
@@ -240,40 +444,17 @@ class PulseTestSuite:
     
     def test_refresh_without_token(self) -> tuple[bool, str]:
         """Test token refresh without refresh token"""
-        status, data = self._request('POST', '/api/v1/auth/refresh', {})
+        with self._no_auth():
+            status, data = self._request('POST', '/api/v1/auth/refresh', raw_body=self._EMPTY_BODY,
+                                         parse_body=False)
         if status in [400, 401]:
             return True, "Refresh without token rejected"
         return False, f"Expected 400 or 401, got {status}"
 
     # ==================== Servers Tests ====================
     
-    def test_servers_requires_auth(self) -> tuple[bool, str]:
-        """Test that servers endpoint requires authentication"""
-        old_token = self.access_token
-        self.access_token = None
-        try:
-            status, data = self._request('GET', '/api/v1/servers')
-            if status != 401:
-                return False, f"Expected 401, got {status}"
-            return True, "Servers endpoint requires auth"
-        finally:
-            self.access_token = old_token
-    
     def test_servers_list_authenticated(self) -> tuple[bool, str]:
         """Test listing servers with valid authentication"""
-        # First login to get a valid token
-        status, data = self._request('POST', '/api/v1/auth/login', {
-            'username': 'admin',
-            'password': 'admin123'
-        })
-        if status != 200:
-            return False, f"Login failed: {status}"
-        
-        self.access_token = data.get('access_token')
-        if not self.access_token:
-            return False, "No access token returned"
-        
-        # Now get servers
         status, data = self._request('GET', '/api/v1/servers')
         if status != 200:
             return False, f"Expected 200, got {status}"
@@ -289,16 +470,6 @@ class PulseTestSuite:
     
     def test_servers_create(self) -> tuple[bool, str]:
         """Test creating a server"""
-        # Ensure we have auth
-        if not self.access_token:
-            status, data = self._request('POST', '/api/v1/auth/login', {
-                'username': 'admin',
-                'password': 'admin123'
-            })
-            if status != 200:
-                return False, f"Login failed: {status}"
-            self.access_token = data.get('access_token')
-        
         # Create a server
         server_data = {
             'name': 'Test Server',
@@ -326,11 +497,11 @@ class PulseTestSuite:
     
     def test_servers_get_by_id(self) -> tuple[bool, str]:
         """Test getting a specific server"""
-        server_id = getattr(self, '_test_server_id', None)
+        server_id = self._test_server_id
         if not server_id:
             return True, "Skipped (no test server created)"
         
-        status, data = self._request('GET', f'/api/v1/servers/{server_id}')
+        status, data = self._request('GET', f'/api/v1/servers/{server_id}', parse_body=False)
         if status != 200:
             return False, f"Expected 200, got {status}"
         
@@ -338,7 +509,7 @@ class PulseTestSuite:
     
     def test_servers_update(self) -> tuple[bool, str]:
         """Test updating a server"""
-        server_id = getattr(self, '_test_server_id', None)
+        server_id = self._test_server_id
         if not server_id:
             return True, "Skipped (no test server created)"
         
@@ -347,7 +518,7 @@ class PulseTestSuite:
             'description': 'Updated via integration test'
         }
         
-        status, data = self._request('PUT', f'/api/v1/servers/{server_id}', update_data)
+        status, data = self._request('PUT', f'/api/v1/servers/{server_id}', update_data, parse_body=False)
         if status != 200:
             return False, f"Expected 200, got {status}"
         
@@ -355,11 +526,11 @@ class PulseTestSuite:
     
     def test_servers_delete(self) -> tuple[bool, str]:
         """Test deleting a server"""
-        server_id = getattr(self, '_test_server_id', None)
+        server_id = self._test_server_id
         if not server_id:
             return True, "Skipped (no test server created)"
         
-        status, data = self._request('DELETE', f'/api/v1/servers/{server_id}')
+        status, data = self._request('DELETE', f'/api/v1/servers/{server_id}', parse_body=False)
         if status not in [200, 204]:
             return False, f"Expected 200 or 204, got {status}"
         
@@ -369,86 +540,34 @@ class PulseTestSuite:
 
     def test_server_metrics(self) -> tuple[bool, str]:
         """Test getting server metrics"""
-        # First create a test server
-        if not self.access_token:
-            status, data = self._request('POST', '/api/v1/auth/login', {
-                'username': 'admin',
-                'password': 'admin123'
-            })
-            if status != 200:
-                return False, f"Login failed: {status}"
-            self.access_token = data.get('access_token')
-        
-        server_data = {
-            'name': 'Metrics Test Server',
-            'hostname': 'metrics.example.com',
-            'port': 22
-        }
-        status, data = self._request('POST', '/api/v1/servers', server_data)
-        if status not in [200, 201]:
-            return False, f"Failed to create test server: {status}"
-        
-        server_id = data.get('server', {}).get('id') or data.get('id')
+        if not self._fixture_server_id:
+            return False, "Fixture server was not created"
         
-        # Get metrics
-        status, data = self._request('GET', f'/api/v1/servers/{server_id}/metrics')
+        status, data = self._request('GET', f'/api/v1/servers/{self._fixture_server_id}/metrics')
         if status != 200:
             return False, f"Expected 200, got {status}"
         
         if 'metrics' not in data:
             return False, "Response missing 'metrics' field"
         
-        # Cleanup
-        self._request('DELETE', f'/api/v1/servers/{server_id}')
-        
         return True, "Server metrics endpoint working"
 
     def test_server_containers(self) -> tuple[bool, str]:
         """Test getting server containers"""
-        if not self.access_token:
-            status, data = self._request('POST', '/api/v1/auth/login', {
-                'username': 'admin',
-                'password': 'admin123'
-            })
-            if status != 200:
-                return False, f"Login failed: {status}"
-            self.access_token = data.get('access_token')
+        if not self._fixture_server_id:
+            return False, "Fixture server was not created"
         
-        server_data = {
-            'name': 'Container Test Server',
-            'hostname': 'containers.example.com',
-            'port': 22
-        }
-        status, data = self._request('POST', '/api/v1/servers', server_data)
-        if status not in [200, 201]:
-            return False, f"Failed to create test server: {status}"
-        
-        server_id = data.get('server', {}).get('id') or data.get('id')
-        
-        # Get containers
-        status, data = self._request('GET', f'/api/v1/servers/{server_id}/containers')
+        status, data = self._request('GET', f'/api/v1/servers/{self._fixture_server_id}/containers')
         if status != 200:
             return False, f"Expected 200, got {status}"
         
         if 'containers' not in data:
             return False, "Response missing 'containers' field"
         
-        # Cleanup
-        self._request('DELETE', f'/api/v1/servers/{server_id}')
-        
         return True, "Server containers endpoint working"
 
     def test_server_credentials(self) -> tuple[bool, str]:
         """Test server credentials CRUD"""
-        if not self.access_token:
-            status, data = self._request('POST', '/api/v1/auth/login', {
-                'username': 'admin',
-                'password': 'admin123'
-            })
-            if status != 200:
-                return False, f"Login failed: {status}"
-            self.access_token = data.get('access_token')
-        
         # Create a test server
         server_data = {
             'name': 'Credentials Test Server',
@@ -464,11 +583,11 @@ class PulseTestSuite:
         # List credentials (should be empty)
         status, data = self._request('GET', f'/api/v1/servers/{server_id}/credentials')
         if status != 200:
-            self._request('DELETE', f'/api/v1/servers/{server_id}')
+            self._request('DELETE', f'/api/v1/servers/{server_id}', parse_body=False)
             return False, f"Expected 200, got {status}"
         
         if 'credentials' not in data:
-            self._request('DELETE', f'/api/v1/servers/{server_id}')
+            self._request('DELETE', f'/api/v1/servers/{server_id}', parse_body=False)
             return False, "Response missing 'credentials' field"
         
         # Create a credential
@@ -480,43 +599,22 @@ class PulseTestSuite:
         }
         status, data = self._request('POST', f'/api/v1/servers/{server_id}/credentials', cred_data)
         if status not in [200, 201]:
-            self._request('DELETE', f'/api/v1/servers/{server_id}')
+            self._request('DELETE', f'/api/v1/servers/{server_id}', parse_body=False)
             return False, f"Failed to create credential: {status}"
         
         cred_id = data.get('credential', {}).get('id')
         
         # Cleanup
         if cred_id:
-            self._request('DELETE', f'/api/v1/servers/{server_id}/credentials/{cred_id}')
-        self._request('DELETE', f'/api/v1/servers/{server_id}')
+            self._request('DELETE', f'/api/v1/servers/{server_id}/credentials/{cred_id}', parse_body=False)
+        self._request('DELETE', f'/api/v1/servers/{server_id}', parse_body=False)
         
         return True, "Server credentials endpoints working"
 
     # ==================== Alert Rules Tests ====================
     
-    def test_alert_rules_requires_auth(self) -> tuple[bool, str]:
-        """Test that alert rules endpoint requires authentication"""
-        old_token = self.access_token
-        self.access_token = None
-        try:
-            status, data = self._request('GET', '/api/v1/alerts/rules')
-            if status != 401:
-                return False, f"Expected 401, got {status}"
-            return True, "Alert rules endpoint requires auth"
-        finally:
-            self.access_token = old_token
-    
     def test_alert_rules_list(self) -> tuple[bool, str]:
         """Test listing alert rules"""
-        if not self.access_token:
-            status, data = self._request('POST', '/api/v1/auth/login', {
-                'username': 'admin',
-                'password': 'admin123'
-            })
-            if status != 200:
-                return False, f"Login failed: {status}"
-            self.access_token = data.get('access_token')
-        
         status, data = self._request('GET', '/api/v1/alerts/rules')
         if status != 200:
             return False, f"Expected 200, got {status}"
@@ -530,15 +628,6 @@ class PulseTestSuite:
     
     def test_alert_rules_create(self) -> tuple[bool, str]:
         """Test creating an alert rule"""
-        if not self.access_token:
-            status, data = self._request('POST', '/api/v1/auth/login', {
-                'username': 'admin',
-                'password': 'admin123'
-            })
-            if status != 200:
-                return False, f"Login failed: {status}"
-            self.access_token = data.get('access_token')
-        
         rule_data = {
             'name': 'Test High CPU',
             'metric_type': 'cpu',
@@ -560,11 +649,11 @@ class PulseTestSuite:
     
     def test_alert_rules_delete(self) -> tuple[bool, str]:
         """Test deleting an alert rule"""
-        rule_id = getattr(self, '_test_alert_rule_id', None)
+        rule_id = self._test_alert_rule_id
         if not rule_id:
             return True, "Skipped (no test alert rule created)"
         
-        status, data = self._request('DELETE', f'/api/v1/alerts/rules/{rule_id}')
+        status, data = self._request('DELETE', f'/api/v1/alerts/rules/{rule_id}', parse_body=False)
         if status not in [200, 204]:
             return False, f"Expected 200 or 204, got {status}"
         
@@ -574,15 +663,6 @@ class PulseTestSuite:
     
     def test_alert_events_list(self) -> tuple[bool, str]:
         """Test listing alert events"""
-        if not self.access_token:
-            status, data = self._request('POST', '/api/v1/auth/login', {
-                'username': 'admin',
-                'password': 'admin123'
-            })
-            if status != 200:
-                return False, f"Login failed: {status}"
-            self.access_token = data.get('access_token')
-        
         status, data = self._request('GET', '/api/v1/alerts/events')
         if status != 200:
             return False, f"Expected 200, got {status}"
@@ -596,29 +676,8 @@ class PulseTestSuite:
 
     # ==================== Notification Channels Tests ====================
     
-    def test_notification_channels_requires_auth(self) -> tuple[bool, str]:
-        """Test that notification channels endpoint requires authentication"""
-        old_token = self.access_token
-        self.access_token = None
-        try:
-            status, data = self._request('GET', '/api/v1/settings/notifications')
-            if status != 401:
-                return False, f"Expected 401, got {status}"
-            return True, "Notification channels endpoint requires auth"
-        finally:
-            self.access_token = old_token
-    
     def test_notification_channels_list(self) -> tuple[bool, str]:
         """Test listing notification channels"""
-        if not self.access_token:
-            status, data = self._request('POST', '/api/v1/auth/login', {
-                'username': 'admin',
-                'password': 'admin123'
-            })
-            if status != 200:
-                return False, f"Login failed: {status}"
-            self.access_token = data.get('access_token')
-        
         status, data = self._request('GET', '/api/v1/settings/notifications')
         if status != 200:
             return False, f"Expected 200, got {status}"
@@ -632,15 +691,6 @@ class PulseTestSuite:
     
     def test_notification_channels_create(self) -> tuple[bool, str]:
         """Test creating a notification channel"""
-        if not self.access_token:
-            status, data = self._request('POST', '/api/v1/auth/login', {
-                'username': 'admin',
-                'password': 'admin123'
-            })
-            if status != 200:
-                return False, f"Login failed: {status}"
-            self.access_token = data.get('access_token')
-        
         channel_data = {
             'name': 'Test Webhook',
             'type': 'webhook',
@@ -659,11 +709,12 @@ class PulseTestSuite:
     
     def test_notification_channels_delete(self) -> tuple[bool, str]:
         """Test deleting a notification channel"""
-        channel_id = getattr(self, '_test_notification_channel_id', None)
+        channel_id = self._test_notification_channel_id
         if not channel_id:
             return True, "Skipped (no test notification channel created)"
         
-        status, data = self._request('DELETE', f'/api/v1/settings/notifications/{channel_id}')
+        status, data = self._request('DELETE', f'/api/v1/settings/notifications/{channel_id}',
+                                     parse_body=False)
         if status not in [200, 204]:
             return False, f"Expected 200 or 204, got {status}"
         
@@ -673,15 +724,6 @@ class PulseTestSuite:
 
     def test_generate_key(self) -> tuple[bool, str]:
         """Test SSH key generation"""
-        if not self.access_token:
-            status, data = self._request('POST', '/api/v1/auth/login', {
-                'username': 'admin',
-                'password': 'admin123'
-            })
-            if status != 200:
-                return False, f"Login failed: {status}"
-            self.access_token = data.get('access_token')
-
         key_data = {
             'name': 'Test Key',
             'key_type': 'ed25519'
@@ -709,10 +751,10 @@ class PulseTestSuite:
         if not self.web_url:
             return True, "Skipped (no web URL configured)"
         
-        status, content = self._web_request('/')
+        status, content = self._web_request('/', max_bytes=SNIFF_BYTES)
         if status != 200:
             return False, f"Expected 200, got {status}"
-        if '<!DOCTYPE html>' not in content.lower() and '<html' not in content.lower():
+        if not self._looks_like_html(content):
             return False, "Response is not HTML"
         return True, "Web app serves HTML"
     
@@ -721,7 +763,8 @@ class PulseTestSuite:
         if not self.web_url:
             return True, "Skipped (no web URL configured)"
         
-        status, content = self._web_request('/main.dart.js')
+        # Only the status matters, so skip transferring the bundle itself
+        status, content = self._web_request('/main.dart.js', method='HEAD')
         if status != 200:
             return False, f"Expected 200 for main.dart.js, got {status}"
         return True, "Flutter JS bundle found"
@@ -731,122 +774,165 @@ class PulseTestSuite:
         if not self.web_url:
             return True, "Skipped (no web URL configured)"
         
-        url = f"{self.web_url}/api/v1/health"
-        req = urllib.request.Request(url)
+        status, content = self._web_request('/api/v1/health')
+        if status != 200:
+            return False, f"Expected 200, got {status}"
         try:
-            with urllib.request.urlopen(req, timeout=10) as response:
-                if response.status != 200:
-                    return False, f"Expected 200, got {response.status}"
-                data = json.loads(response.read().decode())
-                if data.get('status') != 'ok':
-                    return False, "API proxy returned invalid data"
-                return True, "API proxy working"
-        except Exception as e:
+            data = json_loads(content)
+        except ValueError as e:
             return False, str(e)
+        if data.get('status') != 'ok':
+            return False, "API proxy returned invalid data"
+        return True, "API proxy working"
     
     def test_web_app_spa_routing(self) -> tuple[bool, str]:
         """Test that SPA routing works (returns index.html for unknown routes)"""
         if not self.web_url:
             return True, "Skipped (no web URL configured)"
         
-        status, content = self._web_request('/login')
+        status, content = self._web_request('/login', max_bytes=SNIFF_BYTES)
         if status != 200:
             return False, f"Expected 200 for SPA route, got {status}"
-        if '<!DOCTYPE html>' not in content.lower() and '<html' not in content.lower():
+        if not self._looks_like_html(content):
             return False, "SPA route did not return index.html"
         return True, "SPA routing works"
 
+    # ==================== Test Table ====================
+    
+    # Sections of (name, test method) chains, flagged when they need the shared admin
+    # login and fixtures. Chains within a section are independent; the tests inside
+    # one chain share state and run sequentially on a single worker
+    API_TESTS = [
+        ("API Health Tests", False, [
+            [("Health endpoint (/health)", test_health_endpoint)],
+            [("API v1 health (/api/v1/health)", test_api_v1_health_endpoint)],
+        ]),
+        ("Authentication Tests", False, [
+            [("Login - invalid credentials", test_login_invalid_credentials)],
+            [("Login - missing fields", test_login_missing_fields)],
+            [("Login - valid credentials (format validation)", test_login_valid_credentials)],
+            [("Protected endpoints - no auth", test_protected_endpoints_require_auth)],
+            [("Protected endpoint - invalid token", test_protected_endpoint_invalid_token)],
+            [("Logout - without token", test_logout_without_token)],
+            [("Refresh - without token", test_refresh_without_token)],
+        ]),
+        ("Servers API Tests", True, [
+            [
+                ("List servers - authenticated", test_servers_list_authenticated),
+                ("Create server", test_servers_create),
+                ("Get server by ID", test_servers_get_by_id),
+                ("Update server", test_servers_update),
+                ("Delete server", test_servers_delete),
+            ],
+            [("Get server metrics", test_server_metrics)],
+            [("Get server containers", test_server_containers)],
+            [("Server credentials CRUD", test_server_credentials)],
+        ]),
+        ("Alert Rules API Tests", True, [
+            [("List alert rules", test_alert_rules_list)],
+            [
+                ("Create alert rule", test_alert_rules_create),
+                ("Delete alert rule", test_alert_rules_delete),
+            ],
+        ]),
+        ("Alert Events API Tests", True, [
+            [("List alert events", test_alert_events_list)],
+        ]),
+        ("Notification Channels API Tests", True, [
+            [("List notification channels", test_notification_channels_list)],
+            [
+                ("Create notification channel", test_notification_channels_create),
+                ("Delete notification channel", test_notification_channels_delete),
+            ],
+        ]),
+        ("Key Management API Tests", True, [
+            [("Generate SSH key", test_generate_key)],
+        ]),
+    ]
+    
+    WEB_TESTS = [
+        ("Web App Tests", False, [
+            [("Serves HTML", test_web_app_serves_html)],
+            [("Flutter JS bundle", test_web_app_flutter_assets)],
+            [("API proxy", test_web_app_api_proxy)],
+            [("SPA routing", test_web_app_spa_routing)],
+        ]),
+    ]
+
     # ==================== Test Runner ====================
     
     def run_all_tests(self) -> bool:
         """Run all tests and return overall success status"""
-        print(f"\n{BOLD}{'='*60}{RESET}")
+        print(f"\n{BOLD_DIV}")
         print(f"{BOLD}Pulse Server Monitoring - Integration Tests{RESET}")
-        print(f"{BOLD}{'='*60}{RESET}")
+        print(BOLD_DIV)
         print(f"\nAPI URL: {BLUE}{self.api_url}{RESET}")
         if self.web_url:
             print(f"Web URL: {BLUE}{self.web_url}{RESET}")
         print()
         
-        # API Health Tests
-        print(f"\n{BOLD}API Health Tests{RESET}")
-        print("-" * 40)
-        self.run_test("Health endpoint (/health)", self.test_health_endpoint)
-        self.run_test("API v1 health (/api/v1/health)", self.test_api_v1_health_endpoint)
-        
-        # Authentication Tests
-        print(f"\n{BOLD}Authentication Tests{RESET}")
-        print("-" * 40)
-        self.run_test("Login - invalid credentials", self.test_login_invalid_credentials)
-        self.run_test("Login - missing fields", self.test_login_missing_fields)
-        self.run_test("Login - valid credentials (format validation)", self.test_login_valid_credentials)
-        self.run_test("Protected endpoint - no auth", self.test_protected_endpoint_without_auth)
-        self.run_test("Protected endpoint - invalid token", self.test_protected_endpoint_invalid_token)
-        self.run_test("Logout - without token", self.test_logout_without_token)
-        self.run_test("Refresh - without token", self.test_refresh_without_token)
-        
-        # Servers Tests
-        print(f"\n{BOLD}Servers API Tests{RESET}")
-        print("-" * 40)
-        self.run_test("List servers - requires auth", self.test_servers_requires_auth)
-        self.run_test("List servers - authenticated", self.test_servers_list_authenticated)
-        self.run_test("Create server", self.test_servers_create)
-        self.run_test("Get server by ID", self.test_servers_get_by_id)
-        self.run_test("Update server", self.test_servers_update)
-        self.run_test("Get server metrics", self.test_server_metrics)
-        self.run_test("Get server containers", self.test_server_containers)
-        self.run_test("Server credentials CRUD", self.test_server_credentials)
-        self.run_test("Delete server", self.test_servers_delete)
-        
-        # Alert Rules Tests
-        print(f"\n{BOLD}Alert Rules API Tests{RESET}")
-        print("-" * 40)
-        self.run_test("List alert rules - requires auth", self.test_alert_rules_requires_auth)
-        self.run_test("List alert rules", self.test_alert_rules_list)
-        self.run_test("Create alert rule", self.test_alert_rules_create)
-        self.run_test("Delete alert rule", self.test_alert_rules_delete)
-        
-        # Alert Events Tests
-        print(f"\n{BOLD}Alert Events API Tests{RESET}")
-        print("-" * 40)
-        self.run_test("List alert events", self.test_alert_events_list)
-        
-        # Notification Channels Tests
-        print(f"\n{BOLD}Notification Channels API Tests{RESET}")
-        print("-" * 40)
-        self.run_test("List channels - requires auth", self.test_notification_channels_requires_auth)
-        self.run_test("List notification channels", self.test_notification_channels_list)
-        self.run_test("Create notification channel", self.test_notification_channels_create)
-        self.run_test("Delete notification channel", self.test_notification_channels_delete)
-
-        # Key Management Tests
-        print(f"\n{BOLD}Key Management API Tests{RESET}")
-        print("-" * 40)
-        self.run_test("Generate SSH key", self.test_generate_key)
-        
-        # Web App Tests
+        # Untimed warm-up so DNS resolution and the first handshake aren't charged to a test
+        self._request('GET', '/health', parse_body=False)
         if self.web_url:
-            print(f"\n{BOLD}Web App Tests{RESET}")
-            print("-" * 40)
-            self.run_test("Serves HTML", self.test_web_app_serves_html)
-            self.run_test("Flutter JS bundle", self.test_web_app_flutter_assets)
-            self.run_test("API proxy", self.test_web_app_api_proxy)
-            self.run_test("SPA routing", self.test_web_app_spa_routing)
+            self._web_request('/', method='HEAD')
+        
+        # The whole sweep is submitted up front (bounded by the worker count, which
+        # matches the connection pool size) and output is replayed section by section.
+        # Login and fixture setup is queued first, and only the authenticated
+        # sections wait on it.
+        start_ns = time.perf_counter_ns()
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            setup = executor.submit(self._setup_session)
+            pending = []
+            idx = 0
+            for title, requires_auth, chains in self._sections:
+                after = setup if requires_auth else None
+                start = idx
+                futures = []
+                for chain in chains:
+                    futures.append(executor.submit(self._run_chain, idx, chain, after))
+                    idx += len(chain)
+                pending.append((title, start, idx, futures))
+            
+            if not setup.result():
+                if self._setup_error:
+                    reason = f"Session setup failed: {self._setup_error}"
+                else:
+                    reason = "Admin login failed"
+                print(f"  {YELLOW}{reason}; authenticated tests will fail{RESET}")
+            # Nothing is printed from worker threads; once a section's futures are
+            # done its slice of self.results is printed in recorded order
+            for title, start, end, futures in pending:
+                for future in futures:
+                    future.result()
+                sys.stdout.write(f"\n{BOLD}{title}{RESET}\n{SEP}\n")
+                for result in self.results[start:end]:
+                    self._print_result(result)
+                sys.stdout.flush()
+        wall_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        
+        self._teardown_fixtures()
         
         # Summary
-        passed = sum(1 for r in self.results if r.passed)
-        failed = sum(1 for r in self.results if not r.passed)
-        total = len(self.results)
-        total_time = sum(r.duration_ms for r in self.results)
-        
-        print(f"\n{BOLD}{'='*60}{RESET}")
+        passed = failed = 0
+        test_time = 0.0
+        for r in self.results:
+            test_time += r.duration_ms
+            if r.passed:
+                passed += 1
+            else:
+                failed += 1
+        total = passed + failed
+        
+        print(f"\n{BOLD_DIV}")
         print(f"{BOLD}Test Summary{RESET}")
-        print(f"{'='*60}")
+        print(DIV_RULE)
         print(f"  Total:  {total}")
         print(f"  Passed: {GREEN}{passed}{RESET}")
         print(f"  Failed: {RED}{failed}{RESET}")
-        print(f"  Time:   {total_time:.1f}ms")
-        print(f"{'='*60}\n")
+        # Tests overlap, so the summed per-test time exceeds the elapsed time
+        print(f"  Time:   {wall_ms:.1f}ms ({test_time:.1f}ms summed over tests)")
+        print(f"{DIV_RULE}\n")
         
         if failed == 0:
             print(f"{GREEN}{BOLD}✓ All tests passed!{RESET}\n")
@@ -856,6 +942,22 @@ class PulseTestSuite:
             return False
 
 
+def _wait_ready(url: str, end: float, method: str = 'GET') -> bool:
+    """Poll `url` with exponential backoff until it answers below 400 or time.monotonic() passes `end`"""
+    delay = 0.1
+    while True:
+        try:
+            if requests.request(method, url, timeout=0.5).status_code < 400:
+                return True
+        except requests.RequestException:
+            pass
+        remaining = end - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, 1.0)
+
+
 def main():
     parser = argparse.ArgumentParser(description='Pulse Integration Test Suite')
     parser.add_argument('--api-url', default='http://localhost:8080',
@@ -863,15 +965,23 @@ def main():
     parser.add_argument('--web-url', default=None,
                         help='Web app URL (optional)')
     parser.add_argument('--wait', type=int, default=0,
-                        help='Wait seconds before running tests')
+                        help='Wait up to N seconds for the API (and web app, if given) to become ready '
+                             'before running tests')
     args = parser.parse_args()
     
     if args.wait > 0:
-        print(f"Waiting {args.wait} seconds for services to start...")
-        time.sleep(args.wait)
-    
-    suite = PulseTestSuite(args.api_url, args.web_url)
-    success = suite.run_all_tests()
+        print(f"Waiting up to {args.wait} seconds for services to start...")
+        end = time.monotonic() + args.wait
+        services = [('API', f"{args.api_url.rstrip('/')}/health", 'GET')]
+        if args.web_url:
+            services.append(('Web app', f"{args.web_url.rstrip('/')}/", 'HEAD'))
+        for label, url, method in services:
+            if not _wait_ready(url, end, method):
+                print(f"{RED}{BOLD}✗ {label} at {url} did not become ready within {args.wait}s{RESET}")
+                sys.exit(1)
+    
+    with PulseTestSuite(args.api_url, args.web_url) as suite:
+        success = suite.run_all_tests()
     sys.exit(0 if success else 1)
 
 